@@ -77,6 +77,20 @@ class TestDatabaseLock:
 
         lock.release()
 
+    def test_failed_acquire_keeps_holder_pid(self, temp_lock_file):
+        """Test that a failed acquisition does not clobber the holder's PID."""
+        lock1 = DatabaseLock(temp_lock_file)
+        assert lock1.acquire(timeout=2) is True
+
+        lock2 = DatabaseLock(temp_lock_file)
+        assert lock2.acquire(timeout=0) is False
+        assert lock2.lock_file is None
+
+        with open(temp_lock_file, "r") as f:
+            assert f.read().strip() == str(os.getpid())
+
+        lock1.release()
+
     def test_concurrent_lock_acquisition_same_process(self, temp_lock_file):
         """Test that threads in the same process can compete for locks.
 
@@ -132,6 +146,107 @@ class TestDatabaseLock:
         # Cleanup
         lock1.release()
 
+    def test_released_lock_is_picked_up_promptly(self, temp_lock_file):
+        """Test that a waiter acquires the lock as soon as it is released."""
+        lock1 = DatabaseLock(temp_lock_file)
+        assert lock1.acquire(timeout=2) is True
+
+        release_timer = threading.Timer(0.2, lock1.release)
+        release_timer.start()
+
+        lock2 = DatabaseLock(temp_lock_file)
+        start_time = time.time()
+        result = lock2.acquire(timeout=5)
+        elapsed = time.time() - start_time
+        release_timer.join()
+
+        assert result is True
+        assert elapsed < 1.0
+
+        lock2.release()
+
+    def test_brief_contention_is_resolved_by_backoff(self, temp_lock_file, monkeypatch):
+        """Test that a briefly held lock is taken without a blocking wait."""
+
+        def unexpected_wait(self, timeout):
+            raise AssertionError("should not need to block in the kernel")
+
+        monkeypatch.setattr(DatabaseLock, "_wait_for_lock", unexpected_wait)
+
+        lock1 = DatabaseLock(temp_lock_file)
+        assert lock1.acquire(timeout=2) is True
+
+        release_timer = threading.Timer(0.005, lock1.release)
+        release_timer.start()
+
+        lock2 = DatabaseLock(temp_lock_file)
+        result = lock2.acquire(timeout=2)
+        release_timer.join()
+
+        assert result is True
+
+        lock2.release()
+
+    def test_repeated_timeouts_reuse_one_waiter(self, temp_lock_file):
+        """Test that timed-out attempts do not pile up threads and descriptors."""
+        lock1 = DatabaseLock(temp_lock_file)
+        assert lock1.acquire(timeout=2) is True
+
+        lock2 = DatabaseLock(temp_lock_file)
+        assert lock2.acquire(timeout=0.1) is False
+        threads_before = threading.active_count()
+        fds_before = len(os.listdir("/proc/self/fd"))
+
+        for _ in range(10):
+            assert lock2.acquire(timeout=0.1) is False
+
+        assert threading.active_count() == threads_before
+        assert len(os.listdir("/proc/self/fd")) == fds_before
+
+        # The pending wait is resumed and picks up the released lock
+        lock1.release()
+        assert lock2.acquire(timeout=2) is True
+        lock2.release()
+
+    def test_abandoned_wait_lets_go_of_the_lock(self, temp_lock_file):
+        """Test that a wait nobody resumes does not keep the lock."""
+        lock1 = DatabaseLock(temp_lock_file)
+        assert lock1.acquire(timeout=2) is True
+
+        lock2 = DatabaseLock(temp_lock_file)
+        assert lock2.acquire(timeout=0.1) is False
+        lock1.release()
+
+        lock3 = DatabaseLock(temp_lock_file)
+        assert lock3.acquire(timeout=2) is True
+        lock3.release()
+
+    def test_lock_file_removed_while_waiting(self, temp_lock_file):
+        """Test that a waiter does not end up locking a removed lock file."""
+        lock1 = DatabaseLock(temp_lock_file)
+        assert lock1.acquire(timeout=2) is True
+
+        def remove_and_release():
+            os.unlink(temp_lock_file)
+            lock1.release()
+
+        release_timer = threading.Timer(0.2, remove_and_release)
+        release_timer.start()
+
+        lock2 = DatabaseLock(temp_lock_file)
+        result = lock2.acquire(timeout=5)
+        release_timer.join()
+
+        assert result is True
+        assert os.path.exists(temp_lock_file)
+        assert os.fstat(lock2.lock_file).st_ino == os.stat(temp_lock_file).st_ino
+
+        # A third process must now be excluded
+        lock3 = DatabaseLock(temp_lock_file)
+        assert lock3.acquire(timeout=0) is False
+
+        lock2.release()
+
     def test_lock_file_creation_in_nonexistent_directory(self):
         """Test that lock file can be created in a non-existent directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
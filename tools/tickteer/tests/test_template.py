@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the TemplateEngine class functionality.
+
+Tests cover:
+- Template precompilation into segments
+- Rendering of precompiled templates
+- Handling of unknown placeholders
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add parent directory to path to import tickteer module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tickteer import DEFAULT_TEMPLATE, TemplateEngine, Ticket
+
+
+class TestTemplateEngine:
+    """Test cases for TemplateEngine class."""
+
+    @pytest.fixture
+    def ticket(self):
+        """Create a sample ticket for testing."""
+        return Ticket(
+            {
+                "id": "bd-42",
+                "title": "Fix the thing",
+                "description": "It is broken",
+                "status": "open",
+                "priority": 1,
+                "issue_type": "bug",
+                "created_at": "2025-01-01",
+                "created_by": "alice",
+                "updated_at": "2025-01-02",
+            }
+        )
+
+    def test_compile_segments(self):
+        """Test that a template compiles into (literal, key) segments."""
+        segments = TemplateEngine.compile("ID: {{id}} - {{title}}!")
+
+        assert segments == (
+            ("ID: ", "id", "{{id}}"),
+            (" - ", "title", "{{title}}"),
+            ("!", None, ""),
+        )
+
+    def test_compile_without_placeholders(self):
+        """Test that a template without placeholders is a single literal."""
+        assert TemplateEngine.compile("plain text") == (("plain text", None, ""),)
+
+    def test_compile_is_cached(self):
+        """Test that compiling the same template returns the cached result."""
+        assert TemplateEngine.compile(DEFAULT_TEMPLATE) is TemplateEngine.compile(
+            DEFAULT_TEMPLATE
+        )
+
+    def test_render_compiled(self):
+        """Test rendering a precompiled template."""
+        segments = TemplateEngine.compile("{{id}}: {{title}}")
+
+        result = TemplateEngine.render_compiled(segments, {"id": "1", "title": "x"})
+
+        assert result == "1: x"
+
+    def test_unknown_placeholder_is_preserved(self):
+        """Test that placeholders without a value are left untouched."""
+        result = TemplateEngine.render("{{id}} {{missing}}", {"id": "1"})
+
+        assert result == "1 {{missing}}"
+
+    def test_missing_fields_render_empty(self):
+        """Test that missing or null ticket fields render as empty strings."""
+        ticket = Ticket({"id": "bd-1", "title": None})
+
+        data = ticket.get_template_data()
+
+        assert data["title"] == ""
+        assert data["description"] == ""
+        assert data["priority"] == "0"
+        assert data["type_label"] == "UNKNOWN"
+
+    def test_non_string_fields_are_converted(self):
+        """Test that non-string field values render as strings."""
+        ticket = Ticket({"id": 123, "title": "x", "issue_type": "task"})
+
+        result = TemplateEngine.render_compiled(
+            TemplateEngine.compile("{{id}}: {{title}}"), ticket.get_template_data()
+        )
+
+        assert result == "123: x"
+
+    @pytest.mark.parametrize(
+        "priority, expected",
+        [("P1", 1), ("2", 2), ("urgent", 4), ([1], 4), (None, 4), ("", 4)],
+    )
+    def test_priority_parsing(self, priority, expected):
+        """Test that odd priority values are handled per ticket."""
+        assert Ticket({"id": "bd-1", "priority": priority}).priority == expected
+
+    def test_missing_priority_is_critical(self):
+        """Test that a ticket without a priority keeps the default of 0."""
+        assert Ticket({"id": "bd-1"}).priority == 0
+
+    def test_render_ticket_details(self, ticket):
+        """Test rendering the default template for a ticket."""
+        result = TemplateEngine.render_ticket_details(ticket)
+
+        assert "ID: bd-42\n" in result
+        assert "Priority: 🟠 HIGH (1)\n" in result
+        assert "Type: 🐛 Bug\n" in result
+        assert "{{" not in result
+
+
+if __name__ == "__main__":
+    # Run the tests
+    pytest.main([__file__, "-v"])
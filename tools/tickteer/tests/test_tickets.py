@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Tests for fetching and selecting tickets through the bd command.
+
+Tests cover:
+- Parsing the ticket list produced by bd
+- Falling back to the stdlib JSON parser
+- Error handling for failing or missing bd commands
+- Picking the most important ticket
+- Executing commands for a ticket
+- Skipping bd when the Beads store is unchanged
+"""
+
+import json
+import os
+import stat
+import sys
+import threading
+import pytest
+from pathlib import Path
+
+# Add parent directory to path to import tickteer module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import tickteer
+from tickteer import TemplateEngine, Ticket, Tickteer
+
+SAMPLE_TICKETS = [
+    {"id": "bd-1", "title": "Low", "priority": 3, "issue_type": "task"},
+    {"id": "bd-2", "title": "High", "priority": 1, "issue_type": "bug"},
+    {"id": "bd-3", "title": "Also high", "priority": 1, "issue_type": "feature"},
+]
+
+
+def make_fake_bd(directory: Path, stdout: str, exit_code: int = 0) -> str:
+    """Create an executable script that mimics `bd ready --json`.
+
+    Every invocation appends a line to `calls` in the same directory.
+    """
+    output_file = directory / "output.json"
+    output_file.write_text(stdout)
+    calls_file = directory / "calls"
+    script = directory / "bd"
+    script.write_text(
+        f"#!/bin/sh\necho >> '{calls_file}'\ncat '{output_file}'\nexit {exit_code}\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+class TestGetReadyTickets:
+    """Test cases for Tickteer.get_ready_tickets."""
+
+    @pytest.fixture
+    def app(self, tmp_path):
+        """Create a Tickteer instance using a fake bd command."""
+        app = Tickteer()
+        app.bd_command = make_fake_bd(tmp_path, json.dumps(SAMPLE_TICKETS))
+        return app
+
+    def test_parses_tickets(self, app):
+        """Test that all tickets from bd are returned in order."""
+        tickets = list(app.get_ready_tickets())
+
+        assert [t.id for t in tickets] == ["bd-1", "bd-2", "bd-3"]
+        assert tickets[1].priority == 1
+
+    def test_parses_tickets_with_orjson(self, app, monkeypatch):
+        """Test that orjson is used when it is installed."""
+        orjson = pytest.importorskip("orjson")
+        loads = orjson.loads
+        calls = []
+
+        def spy(data):
+            calls.append(data)
+            return loads(data)
+
+        monkeypatch.setattr(orjson, "loads", spy)
+
+        tickets = app.get_ready_tickets()
+
+        assert [t.id for t in tickets] == ["bd-1", "bd-2", "bd-3"]
+        assert len(calls) == 1
+
+    def test_parses_tickets_with_stdlib(self, app, monkeypatch):
+        """Test that the stdlib parser is used without orjson."""
+        monkeypatch.setattr(tickteer, "orjson", None)
+
+        tickets = list(app.get_ready_tickets())
+
+        assert [t.id for t in tickets] == ["bd-1", "bd-2", "bd-3"]
+
+    @pytest.mark.parametrize("disabled", [(), ("orjson",)])
+    def test_invalid_json_exits_with_each_parser(self, tmp_path, monkeypatch, disabled):
+        """Test that malformed output is reported by every parser."""
+        for module in disabled:
+            monkeypatch.setattr(tickteer, module, None)
+        app = Tickteer()
+        app.bd_command = make_fake_bd(tmp_path, '[{"id": ')
+
+        with pytest.raises(SystemExit):
+            list(app.get_ready_tickets())
+
+    def test_empty_list(self, tmp_path):
+        """Test that an empty ticket list yields no tickets."""
+        app = Tickteer()
+        app.bd_command = make_fake_bd(tmp_path, "[]")
+
+        assert list(app.get_ready_tickets()) == []
+
+    def test_failing_command_exits(self, tmp_path):
+        """Test that a non-zero bd exit status exits with an error."""
+        app = Tickteer()
+        app.bd_command = make_fake_bd(tmp_path, "", exit_code=2)
+
+        with pytest.raises(SystemExit):
+            list(app.get_ready_tickets())
+
+    def test_large_stderr_does_not_block(self, tmp_path):
+        """Test that bd writing a lot to stderr before stdout does not hang."""
+        script = tmp_path / "bd"
+        script.write_text(
+            "#!/bin/sh\n"
+            "head -c 200000 /dev/zero | tr '\\0' x >&2\n"
+            'echo \'[{"id": "bd-1"}]\'\n'
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        app = Tickteer()
+        app.bd_command = str(script)
+        result = []
+
+        thread = threading.Thread(
+            target=lambda: result.extend(app.get_ready_tickets()), daemon=True
+        )
+        thread.start()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert [t.id for t in result] == ["bd-1"]
+
+    def test_failure_shows_end_of_stderr(self, tmp_path, capsys):
+        """Test that only the end of a long stderr is reported."""
+        script = tmp_path / "bd"
+        script.write_text(
+            "#!/bin/sh\n"
+            "head -c 100000 /dev/zero | tr '\\0' x >&2\n"
+            "echo 'last words' >&2\n"
+            "exit 3\n"
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        app = Tickteer()
+        app.bd_command = str(script)
+
+        with pytest.raises(SystemExit):
+            list(app.get_ready_tickets())
+
+        err = capsys.readouterr().err
+        assert "last words" in err
+        assert len(err) < 2 * Tickteer.STDERR_TAIL_BYTES
+
+    def test_missing_command_exits(self, tmp_path):
+        """Test that a missing bd binary exits with an error."""
+        app = Tickteer()
+        app.bd_command = os.path.join(str(tmp_path), "does-not-exist")
+
+        with pytest.raises(SystemExit):
+            list(app.get_ready_tickets())
+
+
+class TestMostImportantTicket:
+    """Test cases for Tickteer.get_most_important_ticket."""
+
+    def test_picks_highest_priority(self, tmp_path):
+        """Test that the first ticket with the lowest priority number wins."""
+        app = Tickteer()
+        app.bd_command = make_fake_bd(tmp_path, json.dumps(SAMPLE_TICKETS))
+
+        ticket = app.get_most_important_ticket()
+
+        assert ticket is not None
+        assert ticket.id == "bd-2"
+
+    def test_no_tickets(self, tmp_path):
+        """Test that None is returned when no tickets are ready."""
+        app = Tickteer()
+        app.bd_command = make_fake_bd(tmp_path, "[]")
+
+        assert app.get_most_important_ticket() is None
+
+
+class TestTicketCache:
+    """Test cases for reusing tickets while the Beads store is unchanged."""
+
+    @pytest.fixture
+    def app(self, tmp_path):
+        """Create a Tickteer instance with a fake bd and Beads store."""
+        beads_dir = tmp_path / ".beads"
+        beads_dir.mkdir()
+        (beads_dir / "issues.jsonl").write_text("{}\n")
+
+        app = Tickteer()
+        app.bd_command = make_fake_bd(tmp_path, json.dumps(SAMPLE_TICKETS))
+        app.beads_path = beads_dir
+        return app
+
+    @staticmethod
+    def bd_calls(app):
+        """Count how often the fake bd command was run."""
+        return len(Path(app.bd_command).with_name("calls").read_text().splitlines())
+
+    def test_unchanged_store_skips_bd(self, app):
+        """Test that bd is not run again when the store is unchanged."""
+        first = list(app.get_ready_tickets())
+        second = list(app.get_ready_tickets())
+
+        assert [t.id for t in second] == [t.id for t in first]
+        assert self.bd_calls(app) == 1
+
+    def test_changed_store_runs_bd(self, app):
+        """Test that a modified store triggers a fresh bd call."""
+        list(app.get_ready_tickets())
+        with open(app.beads_path / "issues.jsonl", "a") as f:
+            f.write("{}\n")
+        list(app.get_ready_tickets())
+
+        assert self.bd_calls(app) == 2
+
+    def test_most_important_ticket_fills_cache(self, app, tmp_path):
+        """Test that a CRITICAL ticket before the end still fills the cache."""
+        tickets = [
+            {"id": "bd-1", "priority": 2},
+            {"id": "bd-2", "priority": 0},
+            {"id": "bd-3", "priority": 3},
+        ]
+        (tmp_path / "output.json").write_text(json.dumps(tickets))
+
+        for _ in range(3):
+            assert app.get_most_important_ticket().id == "bd-2"
+
+        assert self.bd_calls(app) == 1
+
+    def test_runtime_files_do_not_invalidate(self, app):
+        """Test that bd's daemon runtime files are ignored."""
+        list(app.get_ready_tickets())
+        (app.beads_path / "daemon.log").write_text("started\n")
+        (app.beads_path / "bd.sock").write_text("")
+        list(app.get_ready_tickets())
+
+        assert self.bd_calls(app) == 1
+
+    def test_sqlite_wal_changes_invalidate(self, app):
+        """Test that writes to a database's -wal file are noticed."""
+        db = app.beads_path / "beads.db"
+        db.write_text("")
+        app.beads_path = db
+        list(app.get_ready_tickets())
+        Path(str(db) + "-wal").write_text("pending")
+        list(app.get_ready_tickets())
+
+        assert self.bd_calls(app) == 2
+
+    def test_invalidate_cache(self, app):
+        """Test that invalidating the cache forces a bd call."""
+        list(app.get_ready_tickets())
+        app.invalidate_cache()
+        list(app.get_ready_tickets())
+
+        assert self.bd_calls(app) == 2
+
+    def test_missing_store_disables_cache(self, app, tmp_path):
+        """Test that bd is always run when the store cannot be inspected."""
+        app.beads_path = tmp_path / "missing"
+
+        list(app.get_ready_tickets())
+        list(app.get_ready_tickets())
+
+        assert self.bd_calls(app) == 2
+
+
+class TestExecuteCommand:
+    """Test cases for Tickteer.execute_command."""
+
+    @pytest.fixture
+    def ticket(self):
+        """Create a sample ticket for testing."""
+        return Ticket(SAMPLE_TICKETS[1])
+
+    def test_arguments_are_passed_without_shell(self, ticket, capsys):
+        """Test that quoted arguments reach the command unchanged."""
+        template = TemplateEngine.compile("{{id}}")
+
+        result = Tickteer().execute_command(
+            "printf", "'%s|' 'a b' '$HOME'", ticket, template, use_stdin=False
+        )
+
+        assert result is True
+        assert "a b|$HOME|" in capsys.readouterr().out
+
+    def test_stdin_receives_rendered_template(self, ticket, capsys):
+        """Test that the rendered template is passed on stdin."""
+        template = TemplateEngine.compile("ticket={{id}}")
+
+        result = Tickteer().execute_command("cat", "", ticket, template)
+
+        assert result is True
+        assert "ticket=bd-2" in capsys.readouterr().out
+
+    def test_template_string_is_accepted(self, ticket, capsys):
+        """Test that an uncompiled template string is rendered as well."""
+        result = Tickteer().execute_command("cat", "", ticket, "ticket={{id}}")
+
+        assert result is True
+        assert "ticket=bd-2" in capsys.readouterr().out
+
+    def test_presplit_argv_is_used(self, ticket, capsys):
+        """Test that a pre-split argv is executed as given."""
+        template = TemplateEngine.compile("")
+
+        result = Tickteer().execute_command(
+            "ignored",
+            "",
+            ticket,
+            template,
+            use_stdin=False,
+            argv=["printf", "%s|", "a b"],
+        )
+
+        assert result is True
+        assert "a b|" in capsys.readouterr().out
+
+    def test_shell_mode(self, ticket, capsys):
+        """Test that shell features work when explicitly enabled."""
+        template = TemplateEngine.compile("{{title}}")
+
+        result = Tickteer().execute_command(
+            "cat", "| tr a-z A-Z", ticket, template, use_shell=True
+        )
+
+        assert result is True
+        assert "HIGH" in capsys.readouterr().out
+
+    def test_failing_command(self, ticket):
+        """Test that a non-zero exit status is reported as failure."""
+        template = TemplateEngine.compile("")
+
+        assert Tickteer().execute_command("false", "", ticket, template) is False
+
+
+if __name__ == "__main__":
+    # Run the tests
+    pytest.main([__file__, "-v"])
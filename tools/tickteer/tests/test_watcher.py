@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the ChangeWatcher class functionality.
+
+Tests cover:
+- Detecting changes in the watched directory
+- Timing out when nothing changes
+- Coalescing bursts of events and ignoring bd runtime files
+- Ignoring SQLite files touched by reads of the database
+- Falling back to sleeping when the path cannot be watched
+"""
+
+import os
+import sqlite3
+import sys
+import time
+import tempfile
+import threading
+import pytest
+from pathlib import Path
+
+# Add parent directory to path to import tickteer module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tickteer import ChangeWatcher
+
+
+class TestChangeWatcher:
+    """Test cases for ChangeWatcher class."""
+
+    @pytest.fixture
+    def watch_dir(self):
+        """Create a temporary directory to watch."""
+        pytest.importorskip("inotify_simple")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    def test_detects_change(self, watch_dir):
+        """Test that a file write wakes up the watcher."""
+        watcher = ChangeWatcher(watch_dir)
+        assert watcher.active
+
+        def write_file():
+            time.sleep(0.1)
+            Path(watch_dir, "issues.jsonl").write_text("{}\n")
+
+        thread = threading.Thread(target=write_file)
+        thread.start()
+
+        start_time = time.time()
+        result = watcher.wait(timeout=5)
+        elapsed = time.time() - start_time
+        thread.join()
+        watcher.close()
+
+        assert result is True
+        assert elapsed < 5
+
+    def test_times_out_without_changes(self, watch_dir):
+        """Test that waiting returns False when nothing changes."""
+        watcher = ChangeWatcher(watch_dir)
+
+        assert watcher.wait(timeout=0.2) is False
+
+        watcher.close()
+
+    def test_burst_triggers_one_wake_up(self, watch_dir):
+        """Test that a burst of writes only wakes the watcher once."""
+        watcher = ChangeWatcher(watch_dir)
+
+        def write_burst():
+            for i in range(5):
+                Path(watch_dir, "issues.jsonl").write_text(f"{i}\n")
+                time.sleep(0.02)
+
+        thread = threading.Thread(target=write_burst)
+        thread.start()
+        first = watcher.wait(timeout=5)
+        thread.join()
+        second = watcher.wait(timeout=0.3)
+        watcher.close()
+
+        assert first is True
+        assert second is False
+
+    def test_runtime_files_are_ignored(self, watch_dir):
+        """Test that writes to bd's runtime files do not wake the watcher."""
+        watcher = ChangeWatcher(watch_dir)
+
+        def write_log():
+            time.sleep(0.05)
+            Path(watch_dir, "daemon.log").write_text("heartbeat\n")
+
+        thread = threading.Thread(target=write_log)
+        thread.start()
+        result = watcher.wait(timeout=0.5)
+        thread.join()
+        watcher.close()
+
+        assert result is False
+
+    @pytest.fixture
+    def wal_db(self, watch_dir):
+        """Create a WAL-mode SQLite database inside the watched directory."""
+        path = os.path.join(watch_dir, "beads.db")
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE issues (id TEXT)")
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_reading_sqlite_db_is_ignored(self, watch_dir, wal_db):
+        """Test that reading a WAL database does not wake the watcher."""
+        watcher = ChangeWatcher(watch_dir)
+
+        def read_db():
+            time.sleep(0.05)
+            conn = sqlite3.connect(wal_db)
+            conn.execute("SELECT * FROM issues").fetchall()
+            conn.close()
+
+        thread = threading.Thread(target=read_db)
+        thread.start()
+        result = watcher.wait(timeout=1)
+        thread.join()
+        watcher.close()
+
+        assert result is False
+
+    def test_writing_sqlite_db_is_detected(self, watch_dir, wal_db):
+        """Test that a write to a WAL database wakes the watcher."""
+        watcher = ChangeWatcher(watch_dir)
+
+        def write_db():
+            time.sleep(0.05)
+            conn = sqlite3.connect(wal_db)
+            conn.execute("INSERT INTO issues VALUES ('bd-1')")
+            conn.commit()
+            conn.close()
+
+        thread = threading.Thread(target=write_db)
+        thread.start()
+        result = watcher.wait(timeout=5)
+        thread.join()
+        watcher.close()
+
+        assert result is True
+
+    def test_missing_path_falls_back_to_sleep(self):
+        """Test that an unwatchable path falls back to sleeping."""
+        watcher = ChangeWatcher(os.path.join(tempfile.gettempdir(), "missing", "x"))
+
+        assert watcher.active is False
+        assert watcher.wait(timeout=0.1) is False
+
+
+if __name__ == "__main__":
+    # Run the tests
+    pytest.main([__file__, "-v"])
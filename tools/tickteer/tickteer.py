@@ -14,12 +14,26 @@ import subprocess
 import sys
 import json
 import time
+import threading
 import re
+import shlex
 import fcntl
 import os
-from typing import List, Dict, Any, Optional
+import random
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # Optional dependency, only useful on Linux
+    INotify = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, fall back to the stdlib parser
+    orjson = None
 
 # Default template for ticket details when using stdin
 DEFAULT_TEMPLATE = """=== TICKET DETAILS ===
@@ -35,17 +49,207 @@ Updated at: {{updated_at}}
 === END TICKET ===
 """
 
+# Runtime files bd keeps in its store directory (see .beads/.gitignore);
+# writes to them do not change which tickets are ready
+BEADS_RUNTIME_FILES = frozenset(
+    {
+        "daemon.lock",
+        "daemon.log",
+        "daemon.pid",
+        "bd.sock",
+        "sync-state.json",
+        "last-touched",
+        ".local_version",
+        ".sync.lock",
+    }
+)
+# Files SQLite keeps next to the Beads db. Merely opening the db creates
+# them and every read updates the -shm index, so only writes to the -wal
+# or -journal content mean the store has changed
+SQLITE_INDEX_SUFFIX = "-shm"
+SQLITE_LOG_SUFFIXES = ("-wal", "-journal")
+
+# Human-readable labels for ticket priorities and issue types
+PRIORITY_LABELS = {
+    0: "🔴 CRITICAL",
+    1: "🟠 HIGH",
+    2: "🟡 MEDIUM",
+    3: "🟢 LOW",
+    4: "⚪ BACKLOG",
+}
+TYPE_LABELS = {"bug": "🐛 Bug", "feature": "✨ Feature", "task": "📝 Task"}
+
+# A template precompiled into (literal, placeholder-or-None, fallback) segments
+CompiledTemplate = Tuple[Tuple[str, Optional[str], str], ...]
+
+
+class ChangeWatcher:
+    """Wait for changes to the Beads store instead of polling blindly.
+
+    Uses inotify when available and falls back to plain sleeping otherwise.
+    """
+
+    # Time to let events accumulate after the first one, so a burst of
+    # writes from a single bd operation only triggers one refresh
+    DEBOUNCE_MS = 250
+
+    def __init__(self, watch_path: str):
+        self.watch_path = watch_path
+        self.inotify = None
+
+        if INotify is None:
+            print(
+                "⚠️  inotify_simple is not installed, falling back to polling",
+                file=sys.stderr,
+            )
+            return
+
+        try:
+            self.inotify = INotify()
+            self.inotify.add_watch(
+                watch_path,
+                inotify_flags.MODIFY | inotify_flags.CREATE | inotify_flags.MOVED_TO,
+            )
+        except (OSError, AttributeError) as e:
+            print(
+                f"⚠️  Could not watch {watch_path}: {e}, falling back to polling",
+                file=sys.stderr,
+            )
+            self.close()
+
+    @property
+    def active(self) -> bool:
+        """Whether change events are actually being watched."""
+        return self.inotify is not None
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the watched path changes or the timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a change was detected, False if the timeout elapsed
+        """
+        if self.inotify is None:
+            time.sleep(timeout)
+            return False
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return False
+
+            events = self.inotify.read(
+                timeout=remaining_ms, read_delay=self.DEBOUNCE_MS
+            )
+            if any(self._is_store_change(event) for event in events):
+                return True
+
+    @staticmethod
+    def _is_store_change(event) -> bool:
+        """Whether an inotify event can change which tickets are ready."""
+        name = event.name
+        # Events on bd's own runtime files (logs, sockets, ...) are noise
+        if name in BEADS_RUNTIME_FILES or name.endswith(SQLITE_INDEX_SUFFIX):
+            return False
+        # Creating a SQLite log does not write anything to it yet
+        return not (
+            event.mask & inotify_flags.CREATE and name.endswith(SQLITE_LOG_SUFFIXES)
+        )
+
+    def close(self):
+        """Stop watching and release the inotify file descriptor."""
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+
+class _LockWaiter:
+    """A blocking flock() on a helper thread that can be abandoned and resumed.
+
+    A blocking flock() cannot be cancelled. When its owner gives up waiting,
+    the waiter keeps the descriptor and either gets resumed by the owner's
+    next attempt, or releases and closes it as soon as flock() returns.
+    """
+
+    def __init__(self, fd: int):
+        self.fd = fd
+        self.acquired = False
+        self.done = False
+        self.abandoned = False
+        self.finished = threading.Event()
+        self.state_lock = threading.Lock()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            acquired = True
+        except (IOError, OSError):
+            acquired = False
+        with self.state_lock:
+            self.done = True
+            if self.abandoned:
+                if acquired:
+                    fcntl.flock(self.fd, fcntl.LOCK_UN)
+                os.close(self.fd)
+            else:
+                self.acquired = acquired
+                self.finished.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for the lock; on failure the descriptor is no longer the caller's."""
+        self.finished.wait(timeout)
+        with self.state_lock:
+            if self.acquired:
+                return True
+            if self.done:
+                # flock() failed, nobody else will close the descriptor
+                os.close(self.fd)
+            else:
+                self.abandoned = True
+            return False
+
+    def resume(self) -> bool:
+        """Take back an abandoned waiter whose flock() is still pending."""
+        with self.state_lock:
+            if self.done:
+                return False
+            self.abandoned = False
+            return True
+
 
 class DatabaseLock:
-    """Handle database locking to prevent race conditions."""
+    """Handle database locking to prevent race conditions.
+
+    flock() locks are dropped by the kernel when their holder exits, so a
+    lock left behind by a dead process never needs to be reclaimed and the
+    lock file is never unlinked.
+    """
+
+    # Non-blocking attempts before backing off
+    SPIN_ATTEMPTS = 50
+    # Jittered, exponentially growing sleeps before waiting in the kernel
+    BACKOFF_INITIAL = 0.001
+    BACKOFF_MAX = 0.05
+    BACKOFF_STEPS = 6
 
     def __init__(self, lock_file_path: str):
         self.lock_file_path = lock_file_path
-        self.lock_file = None
+        # Raw file descriptor of the lock file while it is open
+        self.lock_file: Optional[int] = None
+        # Blocking wait left pending by a previous timed-out acquire()
+        self._waiter: Optional[_LockWaiter] = None
 
     def acquire(self, timeout: int = 10) -> bool:
         """Acquire a file lock with timeout.
 
+        Briefly spins on non-blocking attempts, then retries with a short
+        exponential backoff, and finally blocks in the kernel so a lock held
+        for longer is picked up as soon as it is released.
+
         Args:
             timeout: Maximum seconds to wait for lock acquisition
 
@@ -56,37 +260,128 @@ class DatabaseLock:
             # Create parent directory if it doesn't exist
             Path(self.lock_file_path).parent.mkdir(parents=True, exist_ok=True)
 
-            # Open lock file for writing
-            self.lock_file = open(self.lock_file_path, "w")
-
-            start_time = time.time()
+            deadline = time.monotonic() + timeout
             while True:
-                try:
-                    # Try to acquire exclusive lock (non-blocking)
-                    fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    # Write PID to lock file for debugging
-                    self.lock_file.write(str(os.getpid()))
-                    self.lock_file.flush()
-                    return True
-                except (IOError, OSError):
-                    if time.time() - start_time > timeout:
-                        print(
-                            f"⚠️  Could not acquire lock within {timeout} seconds",
-                            file=sys.stderr,
-                        )
-                        return False
-                    time.sleep(0.1)  # Wait 100ms before retrying
+                if self._waiter is not None and not self._waiter.resume():
+                    # It finished meanwhile and let go of its descriptor
+                    self._waiter = None
+
+                if self._waiter is not None:
+                    # A previous attempt's flock() is still pending, keep
+                    # waiting on it rather than starting another one
+                    remaining = deadline - time.monotonic()
+                    acquired = self._wait_for_lock(max(remaining, 0))
+                else:
+                    # Open lock file for writing. Not truncated yet, as
+                    # another process may be holding the lock; O_CLOEXEC
+                    # keeps the descriptor (and thus the lock) from leaking
+                    # into bd and command children.
+                    self.lock_file = os.open(
+                        self.lock_file_path,
+                        os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC,
+                        0o644,
+                    )
+
+                    acquired = self._spin() or self._backoff(deadline)
+                    if not acquired:
+                        remaining = deadline - time.monotonic()
+                        if remaining > 0:
+                            acquired = self._wait_for_lock(remaining)
+
+                if not acquired:
+                    if self.lock_file is not None:
+                        os.close(self.lock_file)
+                        self.lock_file = None
+                    print(
+                        f"⚠️  Could not acquire lock within {timeout} seconds",
+                        file=sys.stderr,
+                    )
+                    return False
+
+                if self._holds_current_file():
+                    break
+
+                # The lock file was removed or replaced while we waited for
+                # it. A lock on the old file excludes nobody, so start over.
+                self.release()
+
+            # Write PID to lock file for debugging
+            os.ftruncate(self.lock_file, 0)
+            os.write(self.lock_file, str(os.getpid()).encode())
+            return True
 
         except Exception as e:
             print(f"❌ Error acquiring lock: {e}", file=sys.stderr)
             return False
 
+    def _holds_current_file(self) -> bool:
+        """Check that the locked descriptor is still the file at the path."""
+        try:
+            path_stat = os.stat(self.lock_file_path)
+        except FileNotFoundError:
+            return False
+        fd_stat = os.fstat(self.lock_file)
+        return (path_stat.st_dev, path_stat.st_ino) == (
+            fd_stat.st_dev,
+            fd_stat.st_ino,
+        )
+
+    def _try_lock(self) -> bool:
+        """Try to take the exclusive lock without blocking."""
+        try:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except (IOError, OSError):
+            return False
+
+    def _spin(self) -> bool:
+        """Retry the non-blocking lock a few times, yielding in between."""
+        for _ in range(self.SPIN_ATTEMPTS):
+            if self._try_lock():
+                return True
+            os.sched_yield()
+        return False
+
+    def _backoff(self, deadline: float) -> bool:
+        """Retry the non-blocking lock with jittered exponential backoff.
+
+        The jitter keeps competing waiters from retrying in lockstep.
+        """
+        delay = self.BACKOFF_INITIAL
+        for _ in range(self.BACKOFF_STEPS):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay * (0.5 + random.random()), remaining))
+            if self._try_lock():
+                return True
+            delay = min(delay * 2, self.BACKOFF_MAX)
+        return False
+
+    def _wait_for_lock(self, timeout: float) -> bool:
+        """Block on the lock in a helper thread for at most timeout seconds.
+
+        On timeout the descriptor stays with the helper, which the next
+        acquire() resumes, so each instance has at most one pending wait.
+        """
+        if self._waiter is None:
+            self._waiter = _LockWaiter(self.lock_file)
+        waiter = self._waiter
+
+        if waiter.wait(timeout):
+            self._waiter = None
+            self.lock_file = waiter.fd
+            return True
+        # The helper thread now owns the descriptor
+        self.lock_file = None
+        return False
+
     def release(self):
         """Release the file lock and close the file."""
-        if self.lock_file:
+        if self.lock_file is not None:
             try:
-                fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
-                self.lock_file.close()
+                fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+                os.close(self.lock_file)
                 self.lock_file = None
             except Exception as e:
                 print(f"❌ Error releasing lock: {e}", file=sys.stderr)
@@ -95,33 +390,78 @@ class DatabaseLock:
 class Ticket:
     """Represents a Beads ticket."""
 
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "issue_type",
+        "created_at",
+        "created_by",
+        "updated_at",
+        "_template_data",
+    )
+
     def __init__(self, data: Dict[str, Any]):
-        self.id = str(data.get("id", ""))
-        self.title = str(data.get("title", ""))
-        self.description = str(data.get("description", ""))
-        self.status = str(data.get("status", ""))
-        self.priority = data.get("priority", 0)
-        self.issue_type = str(data.get("issue_type", ""))
-        self.created_at = str(data.get("created_at", ""))
-        self.created_by = str(data.get("created_by", ""))
-        self.updated_at = str(data.get("updated_at", ""))
+        get = data.get
+        text = self._text
+        self.id = text(get("id"))
+        self.title = text(get("title"))
+        self.description = text(get("description"))
+        self.status = text(get("status"))
+        # A missing priority keeps its long-standing default of 0
+        self.priority = self._parse_priority(get("priority", 0))
+        self.issue_type = text(get("issue_type"))
+        self.created_at = text(get("created_at"))
+        self.created_by = text(get("created_by"))
+        self.updated_at = text(get("updated_at"))
+        self._template_data: Optional[Dict[str, str]] = None
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        """Convert a field to a string, with missing or null values as ""."""
+        # bd emits strings for nearly every field, so skip str() for those
+        if value is None:
+            return ""
+        return value if isinstance(value, str) else str(value)
+
+    @staticmethod
+    def _parse_priority(value: Any) -> int:
+        """Convert a priority to an int.
+
+        Accepts "P1" style values; anything unreadable, including null or an
+        empty string, is treated as BACKLOG so that it never outranks a ticket
+        with a valid priority.
+        """
+        if isinstance(value, str) and value[:1] in ("P", "p"):
+            value = value[1:]
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 4
 
     def get_template_data(self) -> Dict[str, str]:
-        """Get dictionary of all fields for template substitution."""
-        # Ensure all values are strings
-        return {
-            "id": str(self.id) if self.id else "",
-            "title": str(self.title) if self.title else "",
-            "description": str(self.description) if self.description else "",
-            "status": str(self.status) if self.status else "",
-            "priority": str(self.priority),
-            "priority_label": self._get_priority_label(),
-            "issue_type": str(self.issue_type) if self.issue_type else "",
-            "type_label": self._get_type_label(),
-            "created_by": str(self.created_by) if self.created_by else "",
-            "created_at": str(self.created_at) if self.created_at else "",
-            "updated_at": str(self.updated_at) if self.updated_at else "",
-        }
+        """Get dictionary of all fields for template substitution.
+
+        The dictionary is built once and shared between calls, so callers
+        must not modify it.
+        """
+        if self._template_data is None:
+            self._template_data = {
+                "id": self.id,
+                "title": self.title,
+                "description": self.description,
+                "status": self.status,
+                "priority": str(self.priority),
+                "priority_label": self._get_priority_label(),
+                "issue_type": self.issue_type,
+                "type_label": self._get_type_label(),
+                "created_by": self.created_by,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+            }
+        return self._template_data
 
     def __str__(self) -> str:
         """String representation of the ticket."""
@@ -143,21 +483,11 @@ class Ticket:
 
     def _get_priority_label(self) -> str:
         """Get human-readable priority label."""
-        priority_labels = {
-            0: "🔴 CRITICAL",
-            1: "🟠 HIGH",
-            2: "🟡 MEDIUM",
-            3: "🟢 LOW",
-            4: "⚪ BACKLOG",
-        }
-        return priority_labels.get(self.priority, f"Unknown ({self.priority})")
+        return PRIORITY_LABELS.get(self.priority, f"Unknown ({self.priority})")
 
     def _get_type_label(self) -> str:
         """Get human-readable type label."""
-        type_labels = {"bug": "🐛 Bug", "feature": "✨ Feature", "task": "📝 Task"}
-        # Safely handle None issue_type
-        issue_type_str = str(self.issue_type) if self.issue_type is not None else ""
-        result = type_labels.get(issue_type_str, issue_type_str.upper())
+        result = TYPE_LABELS.get(self.issue_type, self.issue_type.upper())
         return result if result else "UNKNOWN"
 
 
@@ -167,22 +497,61 @@ class TemplateEngine:
     PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
 
     @staticmethod
-    def render(template: str, data: Dict[str, str]) -> str:
-        """Render a template by replacing placeholders with values.
+    @lru_cache(maxsize=None)
+    def compile(template: str) -> CompiledTemplate:
+        """Precompile a template into a sequence of segments.
+
+        Each segment is a ``(literal, key, fallback)`` triple where ``key`` is
+        the placeholder name following the literal, or None for the trailing
+        literal, and ``fallback`` is the placeholder text to keep when no
+        value is given for it. Results are cached per template string.
 
         Args:
             template: Template string with {{placeholder}} syntax
+
+        Returns:
+            Tuple of (literal, key, fallback) segments
+        """
+        parts = TemplateEngine.PLACEHOLDER_PATTERN.split(template)
+        # split() interleaves literals and captured keys: [lit, key, lit, ...]
+        segments = [
+            (parts[i], parts[i + 1], f"{{{{{parts[i + 1]}}}}}")
+            for i in range(0, len(parts) - 1, 2)
+        ]
+        segments.append((parts[-1], None, ""))
+        return tuple(segments)
+
+    @staticmethod
+    def render_compiled(segments: CompiledTemplate, data: Dict[str, str]) -> str:
+        """Render a precompiled template with the given values.
+
+        Args:
+            segments: Segments returned by TemplateEngine.compile
             data: Dictionary mapping placeholder names to values
 
         Returns:
             Rendered string with all placeholders replaced
         """
+        get = data.get
+        return "".join(
+            [
+                lit if key is None else lit + get(key, fallback)
+                for lit, key, fallback in segments
+            ]
+        )
+
+    @staticmethod
+    def render(template: str, data: Dict[str, str]) -> str:
+        """Render a template by replacing placeholders with values.
 
-        def replace_placeholder(match):
-            key = match.group(1)
-            return data.get(key, f"{{{{{key}}}}}")
+        Args:
+            template: Template string with {{placeholder}} syntax
+            data: Dictionary mapping placeholder names to values
 
-        return TemplateEngine.PLACEHOLDER_PATTERN.sub(replace_placeholder, template)
+        Returns:
+            Rendered string with all placeholders replaced
+        """
+        return TemplateEngine.render_compiled(TemplateEngine.compile(template), data)
 
     @staticmethod
     def render_ticket_details(ticket: Ticket) -> str:
@@ -191,31 +560,103 @@ class TemplateEngine:
         return TemplateEngine.render(DEFAULT_TEMPLATE, template_data)
 
 
+def _write_lines(lines: Iterable[str]) -> None:
+    """Write several lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 class Tickteer:
     """Main class for the Tickteer tool."""
 
+    # How much of bd's stderr to show when it fails
+    STDERR_TAIL_BYTES = 4096
+
     def __init__(self):
         self.bd_command = "bd"
+        # Beads store used to detect whether bd's answer can have changed
+        self.beads_path = Path(os.environ.get("BEADS_DB", ".beads"))
+        self._cached_tickets: Optional[List[Ticket]] = None
+        self._cached_signature: Optional[Tuple[int, int, int]] = None
+
+    def _beads_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Summarize the state of the Beads store on disk.
+
+        Returns:
+            (latest mtime, total size, entry count) of the store, or None if
+            it cannot be inspected
+        """
+        try:
+            if self.beads_path.is_dir():
+                paths = [
+                    os.path.join(root, name)
+                    for root, _, files in os.walk(self.beads_path)
+                    for name in files
+                    if name not in BEADS_RUNTIME_FILES
+                ]
+            else:
+                # SQLite keeps recent writes in -wal/-shm files next to the db
+                db = str(self.beads_path)
+                os.stat(db)
+                paths = [
+                    path
+                    for path in (db, db + "-wal", db + "-shm")
+                    if os.path.exists(path)
+                ]
+
+            latest, total = 0, 0
+            for path in paths:
+                st = os.stat(path)
+                latest = max(latest, st.st_mtime_ns)
+                total += st.st_size
+            return (latest, total, len(paths))
+        except OSError:
+            return None
+
+    def invalidate_cache(self) -> None:
+        """Force the next get_ready_tickets call to query bd."""
+        self._cached_tickets = None
+        self._cached_signature = None
 
     def get_ready_tickets(self) -> List[Ticket]:
-        """Fetch ready tickets using the bd command."""
+        """Fetch ready tickets using the bd command.
+
+        The output is parsed with orjson if available. If the Beads store has
+        not changed since the last fetch, the cached tickets are returned
+        instead, so callers must not modify the list.
+        """
+        signature = self._beads_signature()
+        if (
+            signature is not None
+            and signature == self._cached_signature
+            and self._cached_tickets is not None
+        ):
+            return self._cached_tickets
+
+        # bd has no mode for answering repeated queries from one long-lived
+        # process, so each fetch spawns it; the cache above and the change
+        # watcher keep those spawns to when the store has actually changed.
         try:
             result = subprocess.run(
                 [self.bd_command, "ready", "--json"],
                 capture_output=True,
-                text=True,
                 check=True,
             )
 
-            tickets_data = json.loads(result.stdout)
-            return [Ticket(data) for data in tickets_data]
+            if orjson is not None:
+                # Parses the raw bytes directly, without decoding to str first
+                tickets_data = orjson.loads(result.stdout)
+            else:
+                tickets_data = json.loads(result.stdout)
+            tickets = [Ticket(data) for data in tickets_data]
 
         except subprocess.CalledProcessError as e:
+            stderr = e.stderr[-self.STDERR_TAIL_BYTES :]
             print(f"Error running bd command: {e}", file=sys.stderr)
-            print(f"stdout: {e.stdout}", file=sys.stderr)
-            print(f"stderr: {e.stderr}", file=sys.stderr)
+            print(f"stdout: {e.stdout.decode(errors='replace')}", file=sys.stderr)
+            print(f"stderr: {stderr.decode(errors='replace')}", file=sys.stderr)
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Both orjson's and the stdlib's decode errors are ValueErrors
             print(f"Error parsing bd JSON output: {e}", file=sys.stderr)
             sys.exit(1)
         except FileNotFoundError:
@@ -225,7 +666,11 @@ class Tickteer:
             )
             sys.exit(1)
 
-    def sort_tickets_by_priority(self, tickets: List[Ticket]) -> List[Ticket]:
+        self._cached_tickets = tickets
+        self._cached_signature = signature
+        return tickets
+
+    def sort_tickets_by_priority(self, tickets: Iterable[Ticket]) -> List[Ticket]:
         """Sort tickets by priority in ascending order (highest priority first).
 
         In Beads, priority 0 is CRITICAL (highest), 1 is HIGH, 2 is MEDIUM, etc.
@@ -246,56 +691,74 @@ class Tickteer:
             print()
 
     def get_most_important_ticket(self) -> Optional[Ticket]:
-        """Get the single most important ready ticket."""
-        tickets = self.get_ready_tickets()
-        if not tickets:
-            return None
+        """Get the single most important ready ticket.
 
-        sorted_tickets = self.sort_tickets_by_priority(tickets)
-        return sorted_tickets[0]
+        Reads the whole listing, so it is cached for the next call.
+        """
+        return min(self.get_ready_tickets(), key=attrgetter("priority"), default=None)
 
     def execute_command(
         self,
         command: str,
         args: str,
         ticket: Ticket,
-        template: str,
+        template: Union[str, CompiledTemplate],
         use_stdin: bool = True,
+        use_shell: bool = False,
+        argv: Optional[List[str]] = None,
     ) -> bool:
-        """Execute a shell command with ticket details.
+        """Execute a command with ticket details.
 
         Args:
             command: The command to execute
             args: Arguments to pass to the command
             ticket: The ticket to process
-            template: Template string for stdin content
+            template: Template string for stdin content, or one already
+                precompiled with TemplateEngine.compile
             use_stdin: Whether to pass template rendered content to stdin
+            use_shell: Run the command through /bin/sh instead of executing
+                it directly (needed for pipes, redirects, etc.)
+            argv: Command and arguments already split with shlex, to avoid
+                splitting them again for every ticket
 
         Returns:
             True if command executed successfully, False otherwise
         """
         try:
             # Render the template with ticket data
+            if isinstance(template, str):
+                template = TemplateEngine.compile(template)
             template_data = ticket.get_template_data()
-            stdin_content = TemplateEngine.render(template, template_data)
+            stdin_content = TemplateEngine.render_compiled(template, template_data)
 
             # Build the full command
             full_command = command
             if args:
                 full_command += " " + args
 
-            print(f"🚀 Executing: {full_command}")
-            print(f"📝 Ticket: {ticket.id} - {ticket.title}")
+            _write_lines(
+                [
+                    f"🚀 Executing: {full_command}",
+                    f"📝 Ticket: {ticket.id} - {ticket.title}",
+                ]
+            )
 
             # Prepare subprocess execution
             stdin_data = None
             if use_stdin:
                 stdin_data = stdin_content
 
-            # Execute the command
+            # Execute the command directly unless shell features were requested
+            if use_shell:
+                cmd = full_command
+            elif argv is not None:
+                cmd = argv
+            else:
+                cmd = shlex.split(command) + shlex.split(args)
+
             result = subprocess.run(
-                full_command,
-                shell=True,
+                cmd,
+                shell=use_shell,
                 input=stdin_data,
                 text=True,
                 capture_output=True,
@@ -303,15 +766,18 @@ class Tickteer:
             )
 
             # Print output
+            msgs = []
             if result.stdout:
-                print("STDOUT:")
-                print(result.stdout)
+                msgs += ["STDOUT:", result.stdout]
 
             if result.stderr:
-                print("STDERR:")
+                msgs.append("STDERR:")
+                _write_lines(msgs)
                 print(result.stderr, file=sys.stderr)
+                msgs = []
 
-            print(f"✅ Command finished with exit code: {result.returncode}")
+            msgs.append(f"✅ Command finished with exit code: {result.returncode}")
+            _write_lines(msgs)
             return result.returncode == 0
 
         except subprocess.TimeoutExpired:
@@ -328,6 +794,9 @@ class Tickteer:
         template: str,
         template_file: Optional[str],
         interval: int,
+        watch_path: Optional[str] = None,
+        max_staleness: int = 300,
+        use_shell: bool = False,
     ) -> None:
         """Run the daemon mode that continuously processes tickets.
 
@@ -337,6 +806,10 @@ class Tickteer:
             template: Template string for stdin content
             template_file: Path to file containing template
             interval: Seconds to wait between processing tickets
+            watch_path: Beads store directory to watch for changes; when
+                set, tickets are only re-fetched after a change
+            max_staleness: Maximum seconds between checks when watching
+            use_shell: Run the command through /bin/sh
         """
         # Load template from file if specified
         if template_file:
@@ -347,56 +820,93 @@ class Tickteer:
             else:
                 print(f"⚠️  Template file not found: {template_file}, using default")
 
-        print("🎯 Starting Tickteer Daemon")
-        print(f"   Command: {command} {args}")
-        print(f"   Interval: {interval} seconds")
-        print("   Press Ctrl+C to stop")
-        print("-" * 50)
+        # Compile the template and split the command once rather than on
+        # every ticket
+        compiled_template = TemplateEngine.compile(template)
+        argv = None if use_shell else shlex.split(command) + shlex.split(args)
+
+        watcher = ChangeWatcher(watch_path) if watch_path else None
+        watching = watcher is not None and watcher.active
+        if watching:
+            waiting_message = f"Waiting for changes in {watch_path}..."
+        else:
+            waiting_message = f"Waiting {interval} seconds before next check..."
+
+        def wait() -> None:
+            """Wait for the Beads store to change, or for the interval to pass."""
+            if watching:
+                # Woken by a change or the staleness bound, query bd either way
+                watcher.wait(max_staleness)
+                self.invalidate_cache()
+            else:
+                time.sleep(interval)
+
+        msgs = ["🎯 Starting Tickteer Daemon", f"   Command: {command} {args}"]
+        if watching:
+            msgs.append(f"   Watching: {watch_path} (max {max_staleness} seconds)")
+        else:
+            msgs.append(f"   Interval: {interval} seconds")
+        msgs += ["   Press Ctrl+C to stop", "-" * 50]
+        _write_lines(msgs)
 
         processed_count = 0
         last_ticket_id = None
 
         try:
             while True:
-                # Get the most important ticket
+                # Get the most important ticket. Not prefetched while the
+                # previous command runs: that command usually changes the
+                # Beads store, and an unchanged store is served from the cache.
                 ticket = self.get_most_important_ticket()
 
                 if not ticket:
                     print("😴 No ready tickets found. Waiting...")
-                    time.sleep(interval)
+                    wait()
                     continue
 
                 # Skip if we've already processed this ticket
                 if ticket.id == last_ticket_id:
                     print("⏳ Same ticket still ready. Waiting...")
-                    time.sleep(interval)
+                    wait()
                     continue
 
-                print(f"\n🎫 Processing ticket: {ticket.id}")
-                print(f"   Title: {ticket.title}")
-                print(
-                    f"   Priority: {ticket.priority} ({ticket._get_priority_label()})"
+                _write_lines(
+                    [
+                        f"\n🎫 Processing ticket: {ticket.id}",
+                        f"   Title: {ticket.title}",
+                        f"   Priority: {ticket.priority} "
+                        f"({ticket._get_priority_label()})",
+                    ]
                 )
 
                 # Execute the command
                 success = self.execute_command(
-                    command, args, ticket, template, use_stdin=True
+                    command,
+                    args,
+                    ticket,
+                    compiled_template,
+                    use_stdin=True,
+                    use_shell=use_shell,
+                    argv=argv,
                 )
 
                 if success:
                     processed_count += 1
                     last_ticket_id = ticket.id
-                    print(f"✅ Ticket {ticket.id} processed successfully!")
+                    msgs = [f"✅ Ticket {ticket.id} processed successfully!"]
                 else:
-                    print(f"⚠️  Failed to process ticket {ticket.id}")
+                    msgs = [f"⚠️  Failed to process ticket {ticket.id}"]
 
-                print(f"\n⏱️  Waiting {interval} seconds before next check...")
-                print("-" * 50)
-                time.sleep(interval)
+                msgs += [f"\n⏱️  {waiting_message}", "-" * 50]
+                _write_lines(msgs)
+                wait()
 
         except KeyboardInterrupt:
             print(f"\n\n🛑 Daemon stopped by user")
             print(f"📊 Total tickets processed: {processed_count}")
+        finally:
+            if watcher:
+                watcher.close()
 
     def run(self, args: argparse.Namespace) -> None:
         """Main execution method with support for daemon mode.
@@ -413,6 +923,9 @@ class Tickteer:
                 template=template,
                 template_file=args.use_stdin_template_file,
                 interval=args.interval or 30,
+                watch_path=args.watch_path,
+                max_staleness=args.max_staleness,
+                use_shell=args.shell,
             )
         else:
             # Normal mode: just display tickets
@@ -434,9 +947,15 @@ Examples:
   # Run in daemon mode, executing a command for each ticket
   tickteer --daemon --run ./process-ticket.sh --args="--priority high"
   
+  # Run a shell pipeline for each ticket
+  tickteer --daemon --shell --run "my-tool | tee -a tickets.log"
+
   # Use custom template from file
   tickteer --daemon --run my-tool --use-stdin-template-file template.txt
 
+  # Only re-check for tickets when the Beads store changes
+  tickteer --daemon --run my-tool --watch-path .beads
+
 Available placeholders for templates:
   {{id}}           - Ticket ID
   {{title}}        - Ticket title
@@ -469,6 +988,12 @@ Available placeholders for templates:
         "--args", type=str, default="", help="Arguments to pass to the command"
     )
 
+    parser.add_argument(
+        "--shell",
+        action="store_true",
+        help="Run the command through /bin/sh (enables pipes, redirects, etc.)",
+    )
+
     parser.add_argument(
         "--use-stdin-template",
         type=str,
@@ -488,6 +1013,20 @@ Available placeholders for templates:
         help="Seconds to wait between checks in daemon mode (default: 30)",
     )
 
+    parser.add_argument(
+        "--watch-path",
+        type=str,
+        help="Beads store directory (e.g. .beads) to watch for changes in daemon "
+        "mode; tickets are only re-fetched after a change (requires inotify_simple)",
+    )
+
+    parser.add_argument(
+        "--max-staleness",
+        type=int,
+        default=300,
+        help="Maximum seconds between checks when using --watch-path (default: 300)",
+    )
+
     return parser.parse_args()
 
 
@@ -500,6 +1039,14 @@ def main():
         print("❌ Error: --run is required when using --daemon", file=sys.stderr)
         sys.exit(1)
 
+    if args.daemon and not args.shell:
+        try:
+            shlex.split(args.run)
+            shlex.split(args.args or "")
+        except ValueError as e:
+            print(f"❌ Error: could not parse command: {e}", file=sys.stderr)
+            sys.exit(1)
+
     tickteer = Tickteer()
     tickteer.run(args)
 